@@ -1,7 +1,7 @@
 """
 Configuration settings for Play Store Trend Analyzer
 """
-import os
+from utils import ensure_dir
 
 class Config:
     """Configuration settings"""
@@ -15,6 +15,11 @@ class Config:
     LOOKBACK_DAYS = 30
     MAX_REVIEWS_PER_DAY = 50
     MIN_TOPIC_FREQUENCY = 2
+    # Worker processes only pay off for long runs; shorter ones count in-process.
+    # The value is a guess: pool startup costs tens of milliseconds against
+    # under a millisecond of counting per day, but the break-even point has
+    # not been measured on a multi-core machine.
+    MIN_PARALLEL_DAYS = 180
     
     # Topic settings
     SEED_TOPICS = [
@@ -46,5 +51,5 @@ class Config:
     @staticmethod
     def ensure_directories():
         """Create necessary directories"""
-        os.makedirs(Config.REPORTS_DIR, exist_ok=True)
-        os.makedirs("./data", exist_ok=True)
\ No newline at end of file
+        ensure_dir(Config.REPORTS_DIR)
+        ensure_dir("./data")
\ No newline at end of file
@@ -1,15 +1,12 @@
 """
 Main entry point for Play Store Trend Analyzer
 """
-import asyncio
 import argparse
+import os
 import sys
 from datetime import datetime, timedelta
 
 from config import Config
-from mock_data import MockDataGenerator
-from trend_orchestrator import TrendAnalysisOrchestrator
-from utils import print_report_summary, save_reports
 
 def parse_date(date_str: str) -> datetime:
     """Parse date string to datetime object"""
@@ -19,7 +16,17 @@ def parse_date(date_str: str) -> datetime:
         print(f"Error: Invalid date format '{date_str}'. Use YYYY-MM-DD")
         sys.exit(1)
 
-async def main():
+def print_progress(day_count: int, date: datetime, review_count: int, result: dict):
+    """Print the outcome of one day's batch"""
+    if 'error' not in result:
+        print(f"Day {day_count:2d}: {date.strftime('%Y-%m-%d')} - "
+              f"Processed {review_count:3d} reviews, "
+              f"Found {result.get('topic_count', 0):2d} topics")
+    else:
+        print(f"Day {day_count:2d}: {date.strftime('%Y-%m-%d')} - "
+              f"ERROR: {result.get('error', 'Unknown')}")
+
+def main():
     """Main function to run the trend analyzer"""
     parser = argparse.ArgumentParser(
         description="Play Store Trend Analyzer - Analyze app review trends"
@@ -46,9 +53,26 @@ async def main():
         default=Config.REPORTS_DIR,
         help=f"Output directory for reports (default: {Config.REPORTS_DIR})"
     )
+    parser.add_argument(
+        "--formats",
+        choices=["csv", "xlsx", "both"],
+        default="both",
+        help="Report formats to save (default: both)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for topic extraction (default: CPU count)"
+    )
     
     args = parser.parse_args()
     
+    # Deferred so that --help and argument errors skip loading pandas/numpy
+    from mock_data import MockDataGenerator
+    from trend_orchestrator import TrendAnalysisOrchestrator, process_day
+    from utils import print_report_summary, save_reports
+    
     # Ensure directories exist
     Config.ensure_directories()
     
@@ -74,31 +98,60 @@ async def main():
     print("\n📥 Processing review data...")
     print("-" * 70)
     
-    current_date = start_date
-    day_count = 0
+    # Days are independent, so long runs count their topics in worker
+    # processes; short ones would spend more on process startup and
+    # pickling than they save
+    parallel = args.workers > 1 and args.lookback_days + 1 >= Config.MIN_PARALLEL_DAYS
     
-    while current_date <= target_date:
-        day_count += 1
+    if not parallel:
+        current_date = start_date
+        day_count = 0
         
-        # Generate mock reviews for this day
-        reviews = data_generator.generate_daily_reviews(
-            current_date, 
-            args.max_reviews
-        )
-        
-        # Process the batch
-        result = orchestrator.process_daily_batch(reviews, current_date)
+        while current_date <= target_date:
+            day_count += 1
+            
+            # Generate mock reviews for this day
+            reviews = data_generator.generate_daily_reviews(
+                current_date, 
+                args.max_reviews
+            )
+            
+            # Process the batch
+            result = orchestrator.process_daily_batch(reviews, current_date)
+            print_progress(day_count, current_date, len(reviews), result)
+            
+            current_date += timedelta(days=1)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
         
-        # Display progress
-        if 'error' not in result:
-            print(f"Day {day_count:2d}: {current_date.strftime('%Y-%m-%d')} - "
-                  f"Processed {len(reviews):3d} reviews, "
-                  f"Found {result.get('topic_count', 0):2d} topics")
-        else:
-            print(f"Day {day_count:2d}: {current_date.strftime('%Y-%m-%d')} - "
-                  f"ERROR: {result.get('error', 'Unknown')}")
+        # Generate every day's reviews in this process, so the random stream
+        # is the same as a serial run
+        days = []
+        current_date = start_date
+        while current_date <= target_date:
+            reviews = data_generator.generate_daily_reviews(
+                current_date, 
+                args.max_reviews
+            )
+            days.append((current_date, reviews))
+            current_date += timedelta(days=1)
         
-        current_date += timedelta(days=1)
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            # Workers only need the cached lowercase text
+            futures = [
+                pool.submit(process_day, [{'_content_lc': review['_content_lc']} for review in reviews])
+                for _, reviews in days
+            ]
+            
+            for day_count, ((current_date, reviews), future) in enumerate(zip(days, futures), 1):
+                # Process the batch
+                try:
+                    topic_counts = future.result()
+                except Exception as e:
+                    result = orchestrator.batch_error(current_date, e)
+                else:
+                    result = orchestrator.process_daily_batch(reviews, current_date, topic_counts)
+                print_progress(day_count, current_date, len(reviews), result)
     
     # Generate trend report
     print("\n" + "-" * 70)
@@ -111,7 +164,8 @@ async def main():
         csv_file, excel_file = save_reports(
             report, 
             target_date, 
-            args.output_dir
+            args.output_dir,
+            args.formats
         )
         
         # Print summary
@@ -127,4 +181,4 @@ async def main():
 
 if __name__ == "__main__":
     # Run the main function
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
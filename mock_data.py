@@ -2,58 +2,91 @@
 Mock data generator for Play Store reviews
 """
 import random
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from string import Formatter
+
+class _SampledFillers(dict):
+    """Mapping that hands out pre-sampled filler values, one per placeholder looked up"""
+    
+    def __init__(self, fillers: Dict[str, Tuple[str, ...]], counts: Counter):
+        super().__init__()
+        # Draw only as many values per placeholder as the day's templates look up
+        self.samples = {
+            key: iter(random.choices(fillers[key], k=count))
+            for key, count in counts.items() if key in fillers
+        }
+    
+    def __missing__(self, key: str) -> str:
+        samples = self.samples.get(key)
+        return next(samples, '') if samples else ''
 
 class MockDataGenerator:
     """Generates mock Play Store review data"""
     
-    def __init__(self):
-        # Common review templates
-        self.templates = [
-            # Delivery issues
-            "Delivery was {time} late. Very disappointed!",
-            "Food arrived {condition}. Won't order again.",
-            "Delivery partner was {behavior}.",
-            "Order tracking not working properly.",
-            
-            # Food quality issues
-            "Food was {quality}. Not worth the price.",
-            "Received wrong order. {wrong_item} instead.",
-            "Food packaging was damaged.",
-            "Some items were missing from my order.",
-            
-            # App issues
-            "App keeps crashing when I try to {action}.",
-            "Payment {payment_issue} but money deducted.",
-            "Cannot login to my account.",
-            "App is very slow and buggy.",
-            
-            # Positive reviews
-            "Great service! Food arrived hot and fresh.",
-            "Quick delivery and polite delivery partner.",
-            "App works perfectly. Very user friendly.",
-            "Excellent customer support.",
-            
-            # Suggestions
-            "Please add {feature}.",
-            "Should have {improvement}.",
-            "Need better {aspect}.",
-        ]
+    # Common review templates, tagged with the sentiment that drives the score
+    templates = (
+        # Delivery issues
+        ("Delivery was {time} late. Very disappointed!", 'neu'),
+        ("Food arrived {condition}. Won't order again.", 'neu'),
+        ("Delivery partner was {behavior}.", 'neu'),
+        ("Order tracking not working properly.", 'neu'),
         
-        # Fillers for templates
-        self.fillers = {
-            'time': ['1 hour', '2 hours', '30 minutes', '45 minutes'],
-            'condition': ['cold', 'stale', 'spoiled', 'room temperature'],
-            'behavior': ['rude', 'impolite', 'unprofessional'],
-            'quality': ['poor', 'bad', 'terrible', 'awful'],
-            'wrong_item': ['veg burger', 'chicken pizza', 'wrong curry'],
-            'action': ['place order', 'make payment', 'track order'],
-            'payment_issue': ['failed', 'showed error'],
-            'feature': ['dark mode', 'group ordering', 'schedule delivery'],
-            'improvement': ['order tracking', 'search function', 'filters'],
-            'aspect': ['customer support', 'delivery tracking', 'UI']
-        }
+        # Food quality issues
+        ("Food was {quality}. Not worth the price.", 'neg'),
+        ("Received wrong order. {wrong_item} instead.", 'neu'),
+        ("Food packaging was damaged.", 'neu'),
+        ("Some items were missing from my order.", 'neu'),
+        
+        # App issues
+        ("App keeps crashing when I try to {action}.", 'neu'),
+        ("Payment {payment_issue} but money deducted.", 'neu'),
+        ("Cannot login to my account.", 'neu'),
+        ("App is very slow and buggy.", 'neu'),
+        
+        # Positive reviews
+        ("Great service! Food arrived hot and fresh.", 'pos'),
+        ("Quick delivery and polite delivery partner.", 'neu'),
+        ("App works perfectly. Very user friendly.", 'pos'),
+        ("Excellent customer support.", 'pos'),
+        
+        # Suggestions
+        ("Please add {feature}.", 'neu'),
+        ("Should have {improvement}.", 'neu'),
+        ("Need better {aspect}.", 'neu'),
+    )
+    
+    # Placeholders used by each template
+    template_fields = {
+        template: tuple(field for _, field, _, _ in Formatter().parse(template) if field)
+        for template, _ in templates
+    }
+    
+    # Score range for each sentiment tag
+    score_bands = {'pos': (4, 5), 'neg': (1, 2), 'neu': (3, 4)}
+    
+    # Prefixes added to reviews on days with a trending issue
+    trending_prefixes = {
+        'delivery': "Delivery issues today! ",
+        'app': "App problems today! ",
+        'food': "Food quality issues today! ",
+        'payment': "Payment issues today! ",
+    }
+    
+    # Fillers for templates (tuples, as they are shared by all instances)
+    fillers = {
+        'time': ('1 hour', '2 hours', '30 minutes', '45 minutes'),
+        'condition': ('cold', 'stale', 'spoiled', 'room temperature'),
+        'behavior': ('rude', 'impolite', 'unprofessional'),
+        'quality': ('poor', 'bad', 'terrible', 'awful'),
+        'wrong_item': ('veg burger', 'chicken pizza', 'wrong curry'),
+        'action': ('place order', 'make payment', 'track order'),
+        'payment_issue': ('failed', 'showed error'),
+        'feature': ('dark mode', 'group ordering', 'schedule delivery'),
+        'improvement': ('order tracking', 'search function', 'filters'),
+        'aspect': ('customer support', 'delivery tracking', 'UI')
+    }
     
     def generate_daily_reviews(self, date: datetime, count: int = 50) -> List[Dict]:
         """Generate mock reviews for a specific date"""
@@ -66,52 +99,58 @@ class MockDataGenerator:
         # Determine if there's a trending issue
         trending_issue = None
         if random.random() < 0.2:
-            trending_issue = random.choice(['delivery', 'app', 'food', 'payment'])
+            trending_issue = random.choice(list(self.trending_prefixes))
         
-        for i in range(actual_count):
-            # Choose template
-            template = random.choice(self.templates)
-            
+        # Sample the whole day's random choices up front
+        templates = random.choices(self.templates, k=actual_count)
+        
+        # Count placeholders and sentiments so only the values used get drawn
+        field_counts = Counter()
+        sentiment_counts = Counter()
+        for (template, sentiment), n in Counter(templates).items():
+            sentiment_counts[sentiment] += n
+            for field in self.template_fields[template]:
+                field_counts[field] += n
+        
+        fillers = _SampledFillers(self.fillers, field_counts)
+        scores = {
+            sentiment: iter(random.choices(range(low, high + 1), k=sentiment_counts[sentiment]))
+            for sentiment, (low, high) in self.score_bands.items()
+            if sentiment in sentiment_counts
+        }
+        trending = random.choices((True, False), cum_weights=(0.3, 1.0), k=actual_count)
+        user_ids = random.choices(range(1000, 10000), k=actual_count)
+        thumbs_up = random.choices(range(51), k=actual_count)
+        
+        # Same for every review of the day
+        date_str = date.strftime("%Y-%m-%d")
+        id_prefix = "review_" + date.strftime("%Y%m%d") + "_"
+        
+        for i, (template, sentiment) in enumerate(templates):
             # Fill template
-            content = self._fill_template(template)
+            content = self._fill_template(template, fillers)
             
-            # Determine score based on content
-            if any(word in content.lower() for word in ['good', 'great', 'excellent', 'perfect']):
-                score = random.randint(4, 5)
-            elif any(word in content.lower() for word in ['bad', 'poor', 'terrible', 'worst']):
-                score = random.randint(1, 2)
-            else:
-                score = random.randint(3, 4)
+            # Determine score based on the template's sentiment
+            score = next(scores[sentiment])
             
             # Add trending issue if applicable
-            if trending_issue and random.random() < 0.3:
-                if trending_issue == 'delivery':
-                    content = f"Delivery issues today! {content}"
-                elif trending_issue == 'app':
-                    content = f"App problems today! {content}"
-                elif trending_issue == 'food':
-                    content = f"Food quality issues today! {content}"
-                else:
-                    content = f"Payment issues today! {content}"
+            if trending_issue and trending[i]:
+                content = self.trending_prefixes[trending_issue] + content
             
             review = {
                 'content': content,
+                '_content_lc': content.lower(),
                 'score': score,
-                'review_date': date.strftime("%Y-%m-%d"),
-                'review_id': f"review_{date.strftime('%Y%m%d')}_{i:04d}",
-                'user_name': f"User_{random.randint(1000, 9999)}",
-                'thumbs_up_count': random.randint(0, 50)
+                'review_date': date_str,
+                'review_id': "%s%04d" % (id_prefix, i),
+                'user_name': "User_%d" % user_ids[i],
+                'thumbs_up_count': thumbs_up[i]
             }
             
             reviews.append(review)
         
         return reviews
     
-    def _fill_template(self, template: str) -> str:
-        """Fill template placeholders with random values"""
-        result = template
-        for key, values in self.fillers.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in result:
-                result = result.replace(placeholder, random.choice(values))
-        return result
\ No newline at end of file
+    def _fill_template(self, template: str, fillers: _SampledFillers) -> str:
+        """Fill template placeholders with the day's sampled values"""
+        return template.format_map(fillers)
\ No newline at end of file
@@ -2,77 +2,92 @@
 Review analyzer for extracting topics from reviews
 """
 import re
+from collections import Counter
 from typing import List, Dict
 
 class ReviewAnalyzer:
     """Analyzes reviews to extract topics"""
     
+    # Topic keywords mapping
+    topic_patterns = {
+        'Delivery issue': [
+            r'delivery.*late', r'delivery.*delay', r'late.*delivery',
+            r'delayed', r'not.*delivered', r'missed.*delivery'
+        ],
+        'Food stale': [
+            r'food.*cold', r'cold.*food', r'stale', 
+            r'not.*fresh', r'spoiled', r'bad.*food'
+        ],
+        'Delivery partner rude': [
+            r'rude', r'impolite', r'bad.*behavior',
+            r'unprofessional', r'argu.*', r'disrespect'
+        ],
+        'App crashing': [
+            r'app.*crash', r'crash.*app', r'freeze',
+            r'not.*respond', r'hangs', r'bug.*app'
+        ],
+        'Payment issue': [
+            r'payment.*fail', r'fail.*payment', r'transaction.*fail',
+            r'money.*deducted', r'refund', r'payment.*problem'
+        ],
+        'Order cancellation': [
+            r'order.*cancel', r'cancel.*order', r'cancelled',
+            r'order.*not.*placed', r'auto.*cancel'
+        ],
+        'Food quality poor': [
+            r'quality.*poor', r'bad.*quality', r'taste.*bad',
+            r'not.*good', r'worst.*food', r'tasteless'
+        ],
+        'Wrong order delivered': [
+            r'wrong.*order', r'incorrect.*order', r'not.*what.*ordered',
+            r'mistake.*order', r'wrong.*item'
+        ],
+        'Long delivery time': [
+            r'long.*time', r'takes.*hours', r'slow.*delivery',
+            r'waiting.*long', r'delivery.*slow'
+        ],
+        'Customer support unresponsive': [
+            r'support', r'customer.*service', r'no.*response',
+            r'help', r'contact', r'assistance'
+        ],
+    }
+    
+    # Regexes compiled from topic_patterns, built once per process
+    _COMPILED = None
+    
     def __init__(self):
-        # Topic keywords mapping
-        self.topic_patterns = {
-            'Delivery issue': [
-                r'delivery.*late', r'delivery.*delay', r'late.*delivery',
-                r'delayed', r'not.*delivered', r'missed.*delivery'
-            ],
-            'Food stale': [
-                r'food.*cold', r'cold.*food', r'stale', 
-                r'not.*fresh', r'spoiled', r'bad.*food'
-            ],
-            'Delivery partner rude': [
-                r'rude', r'impolite', r'bad.*behavior',
-                r'unprofessional', r'argu.*', r'disrespect'
-            ],
-            'App crashing': [
-                r'app.*crash', r'crash.*app', r'freeze',
-                r'not.*respond', r'hangs', r'bug.*app'
-            ],
-            'Payment issue': [
-                r'payment.*fail', r'fail.*payment', r'transaction.*fail',
-                r'money.*deducted', r'refund', r'payment.*problem'
-            ],
-            'Order cancellation': [
-                r'order.*cancel', r'cancel.*order', r'cancelled',
-                r'order.*not.*placed', r'auto.*cancel'
-            ],
-            'Food quality poor': [
-                r'quality.*poor', r'bad.*quality', r'taste.*bad',
-                r'not.*good', r'worst.*food', r'tasteless'
-            ],
-            'Wrong order delivered': [
-                r'wrong.*order', r'incorrect.*order', r'not.*what.*ordered',
-                r'mistake.*order', r'wrong.*item'
-            ],
-            'Long delivery time': [
-                r'long.*time', r'takes.*hours', r'slow.*delivery',
-                r'waiting.*long', r'delivery.*slow'
-            ],
-            'Customer support unresponsive': [
-                r'support', r'customer.*service', r'no.*response',
-                r'help', r'contact', r'assistance'
-            ],
-        }
+        self._ensure_compiled()
+        self.compiled = self._COMPILED
     
-    def extract_topics(self, reviews: List[Dict]) -> Dict[str, List[str]]:
-        """Extract topics from a batch of reviews"""
-        daily_topics = {}
+    @classmethod
+    def _ensure_compiled(cls):
+        """Compile the topic patterns on first use and cache them on the class"""
+        if cls._COMPILED is not None:
+            return
         
+        # Precompile each topic's patterns into a single alternation.
+        # Patterns are lowercase and matched against lowercased content,
+        # so no re.IGNORECASE is needed.
+        cls._COMPILED = {
+            topic: re.compile('|'.join(f'(?:{p})' for p in patterns))
+            for topic, patterns in cls.topic_patterns.items()
+        }
+    
+    def extract_topics(self, reviews: List[Dict]) -> Counter:
+        """Count the reviews mentioning each topic in a batch"""
+        daily_topics = Counter()
         for review in reviews:
-            content = review.get('content', '').lower()
+            content = self._lowercase(review)
             
             # Check each topic pattern
-            for topic, patterns in self.topic_patterns.items():
-                for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        if topic not in daily_topics:
-                            daily_topics[topic] = []
-                        daily_topics[topic].append(review['content'])
-                        break  # Stop checking other patterns for this topic
+            daily_topics.update(topic for topic, rx in self.compiled.items() if rx.search(content))
         
         return daily_topics
     
-    def count_topics(self, topics_dict: Dict[str, List[str]]) -> Dict[str, int]:
-        """Count occurrences of each topic"""
-        counts = {}
-        for topic, reviews in topics_dict.items():
-            counts[topic] = len(reviews)
-        return counts
\ No newline at end of file
+    @staticmethod
+    def _lowercase(review: Dict) -> str:
+        """Get lowercased content, reusing the cached copy when present"""
+        content = review.get('_content_lc')
+        if content is None:
+            content = review.get('content', '').lower()
+        return content
\ No newline at end of file
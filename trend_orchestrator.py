@@ -3,47 +3,79 @@ Trend analysis orchestrator - main processing engine
 """
 import pandas as pd
 import numpy as np
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from config import Config
 from review_analyzer import ReviewAnalyzer
 
+def process_day(reviews: List[Dict]) -> Counter:
+    """Count topics in one day's reviews (top level so worker processes can run it)"""
+    # ReviewAnalyzer caches its compiled matchers per process, so each
+    # worker builds them once
+    return ReviewAnalyzer().extract_topics(reviews)
+
 class TrendAnalysisOrchestrator:
     """Orchestrates the trend analysis pipeline"""
     
+    # Closed topic set indexing the rows of the count matrix
+    topics = list(Config.SEED_TOPICS) + [
+        topic for topic in ReviewAnalyzer.topic_patterns
+        if topic not in Config.SEED_TOPICS
+    ]
+    topic_idx = {topic: i for i, topic in enumerate(topics)}
+    
     def __init__(self):
-        self.daily_counts = {}
-        self.review_analyzer = ReviewAnalyzer()
+        # Dense (topic, day) count matrix. Column 0 stays zero and stands in
+        # for days that were never processed.
+        self.date_idx = {}
+        self.seen_topics = set()
+        self.matrix = np.zeros((len(self.topics), Config.LOOKBACK_DAYS + 2), np.int32)
     
-    def process_daily_batch(self, reviews: List[Dict], date: datetime) -> Dict:
-        """Process a daily batch of reviews"""
+    def process_daily_batch(self, reviews: List[Dict], date: datetime,
+                            topic_counts: Optional[Counter] = None) -> Dict:
+        """Process a daily batch of reviews
+        
+        Pass topic_counts when they were already computed by process_day,
+        e.g. in a worker process.
+        """
         try:
             date_str = date.strftime("%Y-%m-%d")
             
-            # Extract topics from reviews
-            topics_dict = self.review_analyzer.extract_topics(reviews)
-            
-            # Count topics
-            topic_counts = self.review_analyzer.count_topics(topics_dict)
+            # Count topics mentioned in the reviews
+            if topic_counts is None:
+                topic_counts = process_day(reviews)
             
             # Store counts
-            self.daily_counts[date_str] = topic_counts
+            column = np.zeros(len(self.topics), np.int32)
+            column[[self.topic_idx[topic] for topic in topic_counts]] = list(topic_counts.values())
+            
+            col = self.date_idx.setdefault(date_str, len(self.date_idx) + 1)
+            if col >= self.matrix.shape[1]:
+                # More days processed than the default lookback window
+                self.matrix = np.hstack([self.matrix, np.zeros_like(self.matrix)])
+            self.matrix[:, col] = column
+            self.seen_topics.update(topic_counts)
             
             return {
                 'date': date_str,
                 'review_count': len(reviews),
-                'topic_count': len(topics_dict),
-                'unique_topics': list(topic_counts.keys()),
-                'topics_dict': topics_dict
+                'topic_count': len(topic_counts),
+                'unique_topics': list(topic_counts.keys())
             }
             
         except Exception as e:
-            print(f"Error processing batch for {date}: {e}")
-            return {'date': date.strftime("%Y-%m-%d"), 'error': str(e)}
+            return self.batch_error(date, e)
+    
+    @staticmethod
+    def batch_error(date: datetime, error: Exception) -> Dict:
+        """Report a failed daily batch and build its result"""
+        print(f"Error processing batch for {date}: {error}")
+        return {'date': date.strftime("%Y-%m-%d"), 'error': str(error)}
     
     def generate_trend_report(self, target_date: datetime) -> pd.DataFrame:
         """Generate trend report for the lookback period"""
-        if not self.daily_counts:
+        if not self.date_idx:
             print("No data available. Generating sample report...")
             return self._generate_sample_report(target_date)
         
@@ -53,29 +85,16 @@ class TrendAnalysisOrchestrator:
             date = target_date - timedelta(days=i)
             dates.append(date.strftime("%Y-%m-%d"))
         
-        # Get all unique topics across all days
-        all_topics = set()
-        for day_counts in self.daily_counts.values():
-            all_topics.update(day_counts.keys())
-        all_topics = sorted(all_topics)
-        
-        # Create DataFrame
-        data = {}
-        for topic in all_topics:
-            frequencies = []
-            for date_str in dates:
-                count = self.daily_counts.get(date_str, {}).get(topic, 0)
-                frequencies.append(count)
-            data[topic] = frequencies
-        
-        # Create and return DataFrame
-        df = pd.DataFrame(data, index=dates).T
+        # Gather the report in one go: topics seen so far in sorted order,
+        # missing days read the zero column
+        topics = sorted(self.seen_topics)
+        rows = [self.topic_idx[topic] for topic in topics]
+        cols = [self.date_idx.get(date_str, 0) for date_str in dates]
+        data = self.matrix[np.ix_(rows, cols)]
         
         # Filter out topics with very low frequency
-        total_mentions = df.sum(axis=1)
-        df = df[total_mentions >= Config.MIN_TOPIC_FREQUENCY]
-        
-        return df
+        keep = data.sum(axis=1) >= Config.MIN_TOPIC_FREQUENCY
+        return pd.DataFrame(data[keep], index=np.array(topics, dtype=object)[keep], columns=dates)
     
     def _generate_sample_report(self, target_date: datetime) -> pd.DataFrame:
         """Generate sample report for demonstration"""
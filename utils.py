@@ -1,13 +1,37 @@
 """
 Utility functions for trend analysis
 """
-import pandas as pd
+from __future__ import annotations
+
 import os
 from datetime import datetime
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
+
+# pandas and numpy are imported inside the helpers so that importing this
+# module (e.g. via config) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    
+    WeekMeans = Tuple[np.ndarray, np.ndarray]
+
+# Directories already created by this process
+_mkdir_cache = set()
 
-def create_summary_sheet(report: pd.DataFrame) -> pd.DataFrame:
+def ensure_dir(path: str):
+    """Create a directory, skipping paths already created by this process"""
+    if path not in _mkdir_cache:
+        os.makedirs(path, exist_ok=True)
+        _mkdir_cache.add(path)
+
+def create_summary_sheet(report: pd.DataFrame, row_sums: Optional[pd.Series] = None,
+                         week_means: Optional[WeekMeans] = None) -> pd.DataFrame:
     """Create summary statistics sheet"""
+    import pandas as pd
+    
+    if row_sums is None:
+        row_sums = report.sum(axis=1)
+    
     summary_data = {
         'Metric': [
             'Total Topics Tracked',
@@ -20,84 +44,77 @@ def create_summary_sheet(report: pd.DataFrame) -> pd.DataFrame:
         ],
         'Value': [
             len(report),
-            int(report.sum().sum()),
-            round(report.sum(axis=1).mean(), 2),
-            report.sum(axis=1).idxmax() if len(report) > 0 else 'N/A',
-            report.sum(axis=1).idxmin() if len(report) > 0 else 'N/A',
-            calculate_growth_topics(report),
+            int(row_sums.sum()),
+            round(row_sums.mean(), 2),
+            row_sums.idxmax() if len(report) > 0 else 'N/A',
+            row_sums.idxmin() if len(report) > 0 else 'N/A',
+            calculate_growth_topics(report, week_means=week_means),
             identify_new_topics(report)
         ]
     }
     return pd.DataFrame(summary_data)
 
-def calculate_growth_topics(report: pd.DataFrame, threshold: float = 0.3) -> int:
+def _week_means(report: pd.DataFrame) -> WeekMeans:
+    """Per-topic average of the last week and the week before it"""
+    values = report.to_numpy()
+    last = values[:, -7:].mean(axis=1)
+    prev = values[:, -14:-7].mean(axis=1) if len(report.columns) >= 14 else values[:, :7].mean(axis=1)
+    return last, prev
+
+def _growth_rates(last: np.ndarray, prev: np.ndarray) -> np.ndarray:
+    """Week over week growth, falling back to the last week average without history"""
+    import numpy as np
+    
+    has_prev = prev > 0
+    return np.where(has_prev, (last - prev) / np.where(has_prev, prev, 1), last)
+
+def calculate_growth_topics(report: pd.DataFrame, threshold: float = 0.3,
+                            week_means: Optional[WeekMeans] = None) -> int:
     """Calculate number of topics with significant growth"""
     if len(report.columns) < 7:
         return 0
     
-    last_week = report.columns[-7:].tolist()
-    prev_week = report.columns[-14:-7].tolist() if len(report.columns) >= 14 else report.columns[:7].tolist()
-    
-    growth_count = 0
-    for _, row in report.iterrows():
-        last_avg = row[last_week].mean()
-        prev_avg = row[prev_week].mean() if prev_week else 0
-        
-        if prev_avg > 0 and (last_avg - prev_avg) / prev_avg > threshold:
-            growth_count += 1
-    
-    return growth_count
+    last, prev = week_means if week_means is not None else _week_means(report)
+    return int(((prev > 0) & (_growth_rates(last, prev) > threshold)).sum())
 
 def identify_new_topics(report: pd.DataFrame) -> int:
     """Identify topics that appeared in the last 7 days"""
     if len(report.columns) < 7:
         return 0
     
-    last_week = report.columns[-7:].tolist()
-    new_topics = 0
+    # Slice positionally rather than by date labels
+    values = report.to_numpy()
+    is_new = values[:, -7:].sum(axis=1) > 0
     
-    for _, row in report.iterrows():
-        last_week_sum = row[last_week].sum()
-        
-        if len(report.columns) > 7:
-            before_week = report.columns[:-7].tolist()
-            before_sum = row[before_week].sum()
-            if last_week_sum > 0 and before_sum == 0:
-                new_topics += 1
-        elif last_week_sum > 0:
-            new_topics += 1
-    
-    return new_topics
+    if len(report.columns) > 7:
+        is_new &= values[:, :-7].sum(axis=1) == 0
+    
+    return int(is_new.sum())
 
-def identify_trending_topics(report: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+def identify_trending_topics(report: pd.DataFrame, top_n: int = 10,
+                             row_sums: Optional[pd.Series] = None,
+                             week_means: Optional[WeekMeans] = None) -> pd.DataFrame:
     """Identify top trending topics"""
+    import pandas as pd
+    
     if len(report.columns) < 7:
         return pd.DataFrame()
     
-    # Calculate growth rate
-    growth_data = []
-    last_week = report.columns[-7:].tolist()
-    prev_week = report.columns[-14:-7].tolist() if len(report.columns) >= 14 else report.columns[:7].tolist()
-    
-    for topic, row in report.iterrows():
-        last_avg = row[last_week].mean()
-        prev_avg = row[prev_week].mean() if prev_week else 0
-        
-        if prev_avg > 0:
-            growth_rate = (last_avg - prev_avg) / prev_avg
-        else:
-            growth_rate = last_avg if last_avg > 0 else 0
-        
-        growth_data.append({
-            'Topic': topic,
-            'Last Week Avg': round(last_avg, 2),
-            'Prev Week Avg': round(prev_avg, 2),
-            'Growth Rate': round(growth_rate, 2),
-            'Growth %': f"{round(growth_rate * 100, 1)}%",
-            'Total Mentions': int(row.sum())
-        })
+    if row_sums is None:
+        row_sums = report.sum(axis=1)
     
-    df = pd.DataFrame(growth_data)
+    # Calculate growth rate
+    last, prev = week_means if week_means is not None else _week_means(report)
+    growth = _growth_rates(last, prev)
+    
+    df = pd.DataFrame({
+        'Topic': report.index,
+        'Last Week Avg': last.round(2),
+        'Prev Week Avg': prev.round(2),
+        'Growth Rate': growth.round(2),
+        'Growth %': [f"{pct}%" for pct in (growth * 100).round(1)],
+        'Total Mentions': row_sums.to_numpy().astype(int)
+    })
     df = df.sort_values('Growth Rate', ascending=False).head(top_n)
     return df
 
@@ -110,17 +127,18 @@ def print_report_summary(report: pd.DataFrame, target_date: datetime):
     print(f"\n📊 Basic Statistics:")
     print(f"   • Analysis Period: {len(report.columns)} days")
     print(f"   • Total Topics Tracked: {len(report)}")
-    print(f"   • Total Mentions: {report.sum().sum():,}")
+    row_sums = report.sum(axis=1)
+    print(f"   • Total Mentions: {row_sums.sum():,}")
     
     # Top 5 topics
     print(f"\n🏆 Top 5 Most Frequent Topics:")
-    top_topics = report.sum(axis=1).sort_values(ascending=False).head(5)
+    top_topics = row_sums.sort_values(ascending=False).head(5)
     for i, (topic, count) in enumerate(top_topics.items(), 1):
         print(f"   {i}. {topic}: {int(count)} mentions")
     
     # Trending topics
     if len(report.columns) >= 7:
-        trending_df = identify_trending_topics(report, top_n=5)
+        trending_df = identify_trending_topics(report, top_n=5, row_sums=row_sums)
         if not trending_df.empty:
             print(f"\n📈 Top 5 Trending Topics (Week over Week):")
             for i, row in trending_df.iterrows():
@@ -128,35 +146,49 @@ def print_report_summary(report: pd.DataFrame, target_date: datetime):
                 arrow = "↑" if growth > 0 else "↓"
                 print(f"   • {row['Topic']}: {row['Growth %']} {arrow}")
 
-def save_reports(report: pd.DataFrame, target_date: datetime, output_dir: str):
-    """Save reports in CSV and Excel formats"""
+def save_reports(report: pd.DataFrame, target_date: datetime, output_dir: str,
+                 formats: str = 'both'):
+    """Save reports in CSV and/or Excel formats ('csv', 'xlsx' or 'both')"""
+    import pandas as pd
+    
     date_str = target_date.strftime("%Y%m%d")
+    csv_file = None
+    excel_file = None
     
     # Ensure output directory exists
-    os.makedirs(output_dir, exist_ok=True)
+    ensure_dir(output_dir)
     
     # CSV format
-    csv_file = os.path.join(output_dir, f"trend_report_{date_str}.csv")
-    report.to_csv(csv_file)
-    print(f"\n📄 CSV Report saved: {csv_file}")
+    if formats in ('csv', 'both'):
+        csv_file = os.path.join(output_dir, f"trend_report_{date_str}.csv")
+        report.to_csv(csv_file, chunksize=1000)
+        print(f"\n📄 CSV Report saved: {csv_file}")
+    
+    if formats not in ('xlsx', 'both'):
+        return csv_file, excel_file
     
     # Excel format with multiple sheets
     excel_file = os.path.join(output_dir, f"trend_report_{date_str}.xlsx")
     
+    # Aggregates shared by the sheets below
+    row_sums = report.sum(axis=1)
+    week_means = _week_means(report) if len(report.columns) >= 7 else None
+    
     with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
         # Main trend data
         report.to_excel(writer, sheet_name='Trend Analysis')
         
         # Summary sheet
-        summary_df = create_summary_sheet(report)
+        summary_df = create_summary_sheet(report, row_sums, week_means)
         summary_df.to_excel(writer, sheet_name='Summary', index=False)
         
         # Trending topics sheet
-        trending_df = identify_trending_topics(report, top_n=15)
+        trending_df = identify_trending_topics(report, top_n=15, row_sums=row_sums,
+                                               week_means=week_means)
         trending_df.to_excel(writer, sheet_name='Trending Topics', index=False)
         
         # Top topics sheet
-        top_topics = report.sum(axis=1).sort_values(ascending=False).head(20)
+        top_topics = row_sums.sort_values(ascending=False).head(20)
         top_topics_df = pd.DataFrame({
             'Topic': top_topics.index,
             'Total Mentions': top_topics.values,